@@ -26,9 +26,21 @@ class PygameBackendSettings:
 
     :ivar core: Core backend settings.
     :ivar api: The rendering API to use.
+    :ivar max_fps: Hard cap on presented frames per second, enforced in
+        ``RenderPort.end_frame`` (0 leaves pacing to the core loop).
+    :ivar vsync: Whether to sync presentation to the display refresh.
+        Off by default: vsync blocks in ``end_frame`` until the next
+        refresh, which adds latency and hides frame-time headroom; use
+        ``max_fps`` to bound CPU usage instead.
+    :ivar event_poll_hz: Maximum rate at which ``InputPort.poll`` drains
+        the SDL event queue (0 drains on every poll). Set it to the display
+        refresh rate when the loop runs uncapped.
     """
 
     core: CoreBackendSettings = field(default_factory=CoreBackendSettings)
+    max_fps: int = 0
+    vsync: bool = False
+    event_poll_hz: int = 0
 
     def to_dict(self) -> dict:
         """
@@ -59,5 +71,8 @@ class PygameBackendSettings:
                 renderer=renderer,
                 audio=audio,
                 fonts=fonts,
-            )
+            ),
+            max_fps=int(data.get("max_fps", 0)),
+            vsync=bool(data.get("vsync", False)),
+            event_poll_hz=int(data.get("event_poll_hz", 0)),
         )
@@ -13,10 +13,18 @@ from mini_arcade_core.backend.utils import (  # pyright: ignore[reportMissingImp
 class AudioPort:
     """
     Audio port for the Mini Arcade pygame backend.
+
+    Until ``init`` is called the port is silent: sounds are only
+    registered, and playback/volume calls are no-ops. This lets the mixer
+    stay uninitialized when audio is disabled.
     """
 
     def __init__(self):
         self._sounds: dict[str, pygame.mixer.Sound] = {}
+        # Registered but not yet decoded sounds (see register_sound).
+        self._pending: dict[str, str] = {}
+        self._master: float = 1.0
+        self._enabled = False
 
     def init(
         self, frequency: int = 44100, channels: int = 2, chunk_size: int = 2048
@@ -36,9 +44,11 @@ class AudioPort:
             channels=int(channels),
             buffer=int(chunk_size),
         )
+        self._enabled = True
 
     def shutdown(self):
         """Shutdown the audio subsystem."""
+        self._enabled = False
         pygame.mixer.quit()
 
     def load_sound(self, sound_id: str, path: str):
@@ -51,11 +61,43 @@ class AudioPort:
         :type path: str
         :raises ValueError: If sound_id is empty.
         """
+        if not self._enabled:
+            self.register_sound(sound_id, path)
+            return
         if not sound_id:
             raise ValueError("sound_id cannot be empty")
         p = validate_file_exists(path)
+        self._pending.pop(sound_id, None)
         self._sounds[sound_id] = pygame.mixer.Sound(p)
 
+    def register_sound(self, sound_id: str, path: str):
+        """
+        Register a sound file to be loaded on first use.
+
+        The path is validated immediately, but decoding is deferred until
+        the sound is first played or its volume is set.
+
+        :param sound_id: The identifier for the sound.
+        :type sound_id: str
+        :param path: The path to the sound file.
+        :type path: str
+        :raises ValueError: If sound_id is empty.
+        """
+        if not sound_id:
+            raise ValueError("sound_id cannot be empty")
+        p = validate_file_exists(path)
+        self._sounds.pop(sound_id, None)
+        self._pending[sound_id] = p
+
+    def _sound(self, sound_id: str) -> pygame.mixer.Sound | None:
+        s = self._sounds.get(sound_id)
+        if s is None:
+            path = self._pending.pop(sound_id, None)
+            if path is not None:
+                s = pygame.mixer.Sound(path)
+                self._sounds[sound_id] = s
+        return s
+
     def play_sound(self, sound_id: str, loops: int = 0):
         """
         Play a loaded sound.
@@ -65,9 +107,15 @@ class AudioPort:
         :param loops: The number of times to loop the sound (default: 0).
         :type loops: int
         """
-        s = self._sounds.get(sound_id)
+        if not self._enabled:
+            return
+        s = self._sound(sound_id)
         if s:
-            s.play(loops=int(loops))
+            ch = s.play(loops=int(loops))
+            # Master volume lives on the channel (sound.play() resets it),
+            # per-sound volume stays on the Sound itself.
+            if ch is not None:
+                ch.set_volume(self._master)
 
     def set_master_volume(self, volume: int):
         """
@@ -77,9 +125,16 @@ class AudioPort:
         :type volume: int
         """
         v = max(0, min(128, int(volume))) / 128.0
+        self._master = v
+        if not self._enabled:
+            return
         pygame.mixer.music.set_volume(v)
-        for s in self._sounds.values():
-            s.set_volume(v)
+        # Only already-playing channels need updating; new plays pick up
+        # the master volume in play_sound.
+        for i in range(pygame.mixer.get_num_channels()):
+            ch = pygame.mixer.Channel(i)
+            if ch.get_busy():
+                ch.set_volume(v)
 
     def set_sound_volume(self, sound_id: str, volume: int):
         """
@@ -90,7 +145,9 @@ class AudioPort:
         :param volume: The volume for the sound (0-100).
         :type volume: int
         """
-        s = self._sounds.get(sound_id)
+        if not self._enabled:
+            return
+        s = self._sound(sound_id)
         if not s:
             return
         v = max(0, min(128, int(volume))) / 128.0
@@ -98,4 +155,5 @@ class AudioPort:
 
     def stop_all(self):
         """Stop all currently playing sounds."""
-        pygame.mixer.stop()
+        if self._enabled:
+            pygame.mixer.stop()
@@ -40,5 +40,5 @@ class CapturePort:
         :rtype: tuple[int, int, bytes]
         """
         w, h = self._w.screen.get_size()
-        data = pygame.image.tostring(self._w.screen, "ARGB")
+        data = pygame.image.tobytes(self._w.screen, "ARGB")
         return int(w), int(h), data
@@ -5,6 +5,9 @@ Provides functionality to poll and map input events.
 
 from __future__ import annotations
 
+import time
+from typing import Callable
+
 import pygame
 from mini_arcade_core.backend.events import (  # pyright: ignore[reportMissingImports]
     Event,
@@ -12,6 +15,8 @@ from mini_arcade_core.backend.events import (  # pyright: ignore[reportMissingIm
 )
 from mini_arcade_core.backend.keys import Key
 
+from mini_arcade_pygame_backend.ports.window import WindowPort
+
 PYGAME_KEY_TO_KEY: dict[int, Key] = {
     pygame.K_ESCAPE: Key.ESCAPE,
     pygame.K_RETURN: Key.ENTER,
@@ -34,12 +39,114 @@ PYGAME_KEY_TO_KEY: dict[int, Key] = {
     pygame.K_F10: Key.F10,
     pygame.K_F11: Key.F11,
     pygame.K_F12: Key.F12,
+    # Letters / numbers:
+    **{
+        getattr(pygame, f"K_{c}"): Key[c.upper()]
+        for c in "abcdefghijklmnopqrstuvwxyz"
+    },
+    **{getattr(pygame, f"K_{i}"): Key[f"NUM_{i}"] for i in range(10)},
 }
-# Letters / numbers:
-for c in "abcdefghijklmnopqrstuvwxyz":
-    PYGAME_KEY_TO_KEY[getattr(pygame, f"K_{c}")] = getattr(Key, c.upper())
-for i in range(10):
-    PYGAME_KEY_TO_KEY[getattr(pygame, f"K_{i}")] = getattr(Key, f"NUM_{i}")
+
+# Bound lookup used on the event hot path.
+# NOTE: pygame key codes are sparse (arrow/function keys live above
+# 1 << 30), so a flat list indexed by key code is not an option here.
+_key_for = PYGAME_KEY_TO_KEY.get
+
+
+def _on_quit(_ev) -> Event:
+    return Event(type=EventType.QUIT)
+
+
+def _on_keydown(ev) -> Event:
+    return Event(
+        type=EventType.KEYDOWN,
+        key=_key_for(ev.key),
+        key_code=ev.key,
+        scancode=getattr(ev, "scancode", None),
+        mod=getattr(ev, "mod", None),
+        repeat=bool(getattr(ev, "repeat", False)),
+    )
+
+
+def _on_keyup(ev) -> Event:
+    return Event(
+        type=EventType.KEYUP,
+        key=_key_for(ev.key),
+        key_code=ev.key,
+        scancode=getattr(ev, "scancode", None),
+        mod=getattr(ev, "mod", None),
+        repeat=False,
+    )
+
+
+def _on_videoresize(ev) -> Event:
+    return Event(
+        type=EventType.WINDOWRESIZED,
+        size=(ev.w, ev.h),
+    )
+
+
+def _on_textinput(ev) -> Event:
+    return Event(type=EventType.TEXTINPUT, text=str(ev.text))
+
+
+def _motion_event(x: int, y: int, dx: int, dy: int) -> Event:
+    return Event(
+        type=EventType.MOUSEMOTION,
+        x=x,
+        y=y,
+        dx=dx,
+        dy=dy,
+    )
+
+
+def _on_mousebuttondown(ev) -> Event:
+    # Wheel events are also mouse buttons in older pygame, but pygame2 has MOUSEWHEEL.
+    return Event(
+        type=EventType.MOUSEBUTTONDOWN,
+        button=ev.button,
+        x=ev.pos[0],
+        y=ev.pos[1],
+    )
+
+
+def _on_mousebuttonup(ev) -> Event:
+    return Event(
+        type=EventType.MOUSEBUTTONUP,
+        button=ev.button,
+        x=ev.pos[0],
+        y=ev.pos[1],
+    )
+
+
+def _on_mousewheel(ev) -> Event:
+    return Event(
+        type=EventType.MOUSEWHEEL,
+        wheel=(ev.x, ev.y),
+    )
+
+
+# pygame event type -> core event builder
+# (MOUSEMOTION is coalesced in InputPort.poll and not listed here)
+_HANDLERS: dict[int, Callable[[pygame.event.Event], Event]] = {
+    pygame.QUIT: _on_quit,
+    pygame.KEYDOWN: _on_keydown,
+    pygame.KEYUP: _on_keyup,
+    pygame.VIDEORESIZE: _on_videoresize,
+    pygame.TEXTINPUT: _on_textinput,
+    pygame.MOUSEBUTTONDOWN: _on_mousebuttondown,
+    pygame.MOUSEBUTTONUP: _on_mousebuttonup,
+    pygame.MOUSEWHEEL: _on_mousewheel,
+}
+
+
+# Every pygame event type poll() turns into a core event.
+_CONSUMED_TYPES = (*_HANDLERS, pygame.MOUSEMOTION)
+
+# Event types whose drain time is recorded for latency measurement.
+_LATENCY_TYPES = frozenset(
+    (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN)
+)
 
 
 class InputPort:
@@ -47,95 +154,96 @@ class InputPort:
     Input port for the Mini Arcade pygame backend.
     """
 
+    def __init__(self, window: WindowPort | None = None, poll_hz: int = 0):
+        """
+        :param window: Window to notify about resize events, if any.
+        :type window: WindowPort | None
+        :param poll_hz: Maximum rate at which the SDL event queue is drained
+            (0 = on every poll). Events arriving in between stay queued.
+        :type poll_hz: int
+        """
+        self._window = window
+        self._out: list[Event] = []
+        self._poll_period = 1.0 / poll_hz if poll_hz > 0 else 0.0
+        self._last_poll = 0.0
+        self._last_input_drain_time: float | None = None
+
+    @property
+    def last_input_drain_time(self) -> float | None:
+        """
+        ``time.perf_counter()`` value at which poll() drained the latest key
+        press/release or mouse button press, or None if none was seen yet.
+
+        pygame events carry no timestamp, so this is when the event left the
+        queue, not when it was generated. Compare against
+        ``RenderPort.last_present_time`` to measure drain to present latency.
+
+        :return: perf_counter time in seconds, or None.
+        :rtype: float | None
+        """
+        return self._last_input_drain_time
+
+    def install_event_filter(self):
+        """
+        Block every SDL event type that poll() does not map, so unused
+        high-rate events (joystick axes, window/audio device notifications)
+        never reach the Python-side queue.
+
+        Supporting a new event type means adding it to the handler table,
+        which also adds it to this allow-list.
+        """
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(_CONSUMED_TYPES))
+
     def poll(self) -> list[Event]:
         """
         Poll for input events and map them to core events.
 
+        The returned list is reused by the next call; consume (or copy) it
+        before polling again.
+
         :return: A list of core events.
         :rtype: list[Event]
         """
-        out: list[Event] = []
+        out = self._out
+        out.clear()
+        if self._poll_period:
+            now = time.monotonic()
+            if now - self._last_poll < self._poll_period:
+                return out
+            self._last_poll = now
+        handlers = _HANDLERS
+        motion = None  # pending (x, y, dx, dy) for a run of motion events
+        drained = None  # read lazily: most polls carry no timed event
         for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                out.append(Event(type=EventType.QUIT))
-
-            elif ev.type == pygame.KEYDOWN:
-                k = PYGAME_KEY_TO_KEY.get(ev.key)
-                out.append(
-                    Event(
-                        type=EventType.KEYDOWN,
-                        key=k,
-                        key_code=int(ev.key),
-                        scancode=getattr(ev, "scancode", None),
-                        mod=getattr(ev, "mod", None),
-                        repeat=bool(getattr(ev, "repeat", False)),
-                    )
-                )
-
-            elif ev.type == pygame.KEYUP:
-                k = PYGAME_KEY_TO_KEY.get(ev.key)
-                out.append(
-                    Event(
-                        type=EventType.KEYUP,
-                        key=k,
-                        key_code=int(ev.key),
-                        scancode=getattr(ev, "scancode", None),
-                        mod=getattr(ev, "mod", None),
-                        repeat=False,
-                    )
-                )
-
-            elif ev.type == pygame.VIDEORESIZE:
-                out.append(
-                    Event(
-                        type=EventType.WINDOWRESIZED,
-                        size=(int(ev.w), int(ev.h)),
-                    )
-                )
-
-            elif ev.type == pygame.TEXTINPUT:
-                out.append(Event(type=EventType.TEXTINPUT, text=str(ev.text)))
-
-            elif ev.type == pygame.MOUSEMOTION:
-                x, y = ev.pos
+            if ev.type == pygame.MOUSEMOTION:
+                # Coalesce consecutive motion into one event: final position,
+                # summed deltas. Runs are broken by any mapped event so ordering
+                # relative to clicks/keys is preserved.
                 dx, dy = ev.rel
-                out.append(
-                    Event(
-                        type=EventType.MOUSEMOTION,
-                        x=int(x),
-                        y=int(y),
-                        dx=int(dx),
-                        dy=int(dy),
-                    )
-                )
-
-            elif ev.type == pygame.MOUSEBUTTONDOWN:
-                # Wheel events are also mouse buttons in older pygame, but pygame2 has MOUSEWHEEL.
-                out.append(
-                    Event(
-                        type=EventType.MOUSEBUTTONDOWN,
-                        button=int(ev.button),
-                        x=int(ev.pos[0]),
-                        y=int(ev.pos[1]),
-                    )
-                )
-
-            elif ev.type == pygame.MOUSEBUTTONUP:
-                out.append(
-                    Event(
-                        type=EventType.MOUSEBUTTONUP,
-                        button=int(ev.button),
-                        x=int(ev.pos[0]),
-                        y=int(ev.pos[1]),
-                    )
-                )
-
-            elif ev.type == pygame.MOUSEWHEEL:
-                out.append(
-                    Event(
-                        type=EventType.MOUSEWHEEL,
-                        wheel=(int(ev.x), int(ev.y)),
-                    )
-                )
+                if motion is None:
+                    motion = [ev.pos[0], ev.pos[1], dx, dy]
+                else:
+                    motion[0], motion[1] = ev.pos
+                    motion[2] += dx
+                    motion[3] += dy
+                continue
+
+            h = handlers.get(ev.type)
+            if h is None:
+                continue
+            if motion is not None:
+                out.append(_motion_event(*motion))
+                motion = None
+            out.append(h(ev))
+            if ev.type in _LATENCY_TYPES:
+                if drained is None:
+                    drained = time.perf_counter()
+                self._last_input_drain_time = drained
+            if ev.type == pygame.VIDEORESIZE and self._window is not None:
+                self._window.on_resize_event(ev.w, ev.h)
+
+        if motion is not None:
+            out.append(_motion_event(*motion))
 
         return out
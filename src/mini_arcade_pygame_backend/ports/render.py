@@ -5,6 +5,10 @@ Provides functionality to draw shapes and manage rendering state.
 
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
+from typing import Iterable
+
 import pygame
 from mini_arcade_core.backend.utils import (  # pyright: ignore[reportMissingImports]
     rgba,
@@ -13,7 +17,14 @@ from mini_arcade_core.backend.viewport import ViewportTransform
 
 from mini_arcade_pygame_backend.ports.window import WindowPort  # type: ignore
 
+# Pixel budget for scaled texture copies kept around for re-use
+# (~64 MB at 32 bpp). Bounded by size, not count, so zoom animations
+# that produce a new scale every frame cannot pin large surfaces.
+_SCALED_CACHE_PIXELS = 16 * 1024 * 1024
+
 
+# Justification: Render state plus texture caches
+# pylint: disable=too-many-instance-attributes
 class RenderPort:
     """
     Render port for the Mini Arcade native backend.
@@ -22,6 +33,8 @@ class RenderPort:
     :type native_backend: native.Backend
     :param vp: The viewport transform.
     :type vp: ViewportTransform
+    :param max_fps: Frame rate cap applied in end_frame (0 = uncapped).
+    :type max_fps: int
     """
 
     def __init__(
@@ -29,12 +42,21 @@ class RenderPort:
         window: WindowPort,
         vp: ViewportTransform,
         background_color=(0, 0, 0),
+        max_fps: int = 0,
     ):
         self._w = window
         self._vp = vp
         self._clear = rgba(background_color)
+        self._max_fps = max(0, int(max_fps))
+        self._clock = pygame.time.Clock() if self._max_fps else None
+        self._skip_clear = False
+        self._last_present_time = 0.0
         self._next_tex_id: int = 1
         self._textures: dict[int, pygame.Surface] = {}
+        self._scaled_cache: OrderedDict[
+            tuple[int, int, int], pygame.Surface
+        ] = OrderedDict()
+        self._scaled_pixels = 0
 
     def set_clear_color(self, r: int, g: int, b: int):
         """
@@ -49,14 +71,45 @@ class RenderPort:
         """
         self._clear = (int(r), int(g), int(b), 255)
 
+    def set_skip_clear(self, skip: bool):
+        """
+        Skip the background clear in begin_frame.
+
+        Useful when the scene always covers the whole screen, where the
+        full-screen fill is wasted memory bandwidth.
+
+        :param skip: True to skip clearing, False to clear every frame.
+        :type skip: bool
+        """
+        self._skip_clear = bool(skip)
+
     def begin_frame(self):
         """Begin a new rendering frame."""
+        screen = self._w.screen
+        # Drop any clip left over from the previous frame.
+        screen.set_clip(None)
+        if self._skip_clear:
+            return
         r, g, b, _ = self._clear
-        self._w.screen.fill((r, g, b))
+        screen.fill((r, g, b))
 
     def end_frame(self):
         """End the current rendering frame."""
         pygame.display.flip()
+        self._last_present_time = time.perf_counter()
+        if self._clock is not None:
+            self._clock.tick(self._max_fps)
+
+    @property
+    def last_present_time(self) -> float:
+        """
+        ``time.perf_counter()`` value at which the last frame finished
+        presenting (0.0 before the first frame).
+
+        :return: perf_counter time in seconds.
+        :rtype: float
+        """
+        return self._last_present_time
 
     def set_clip_rect(self, x: int, y: int, w: int, h: int):
         """
@@ -73,7 +126,7 @@ class RenderPort:
         """
         # IMPORTANT: the pipeline passes viewport_w/h and assumes viewport
         # transform has been applied.
-        self._w.screen.set_clip(pygame.Rect(int(x), int(y), int(w), int(h)))
+        self._w.screen.set_clip(pygame.Rect(x, y, w, h))
 
     def clear_clip_rect(self):
         """Clear the clipping rectangle."""
@@ -97,13 +150,55 @@ class RenderPort:
         :type color: tuple[int, int, int] | tuple[int, int, int, int]
         """
         r, g, b, _ = rgba(color)
-        sx, sy = self._vp.map_xy(int(x), int(y))
-        sw, sh = self._vp.map_wh(int(w), int(h))
-        # alpha: pygame.draw supports alpha only if surface has per-pixel alpha;
-        # simplest: ignore alpha for now, or use a temp surface if you really need it.
-        pygame.draw.rect(
-            self._w.screen, (r, g, b), pygame.Rect(sx, sy, sw, sh)
-        )
+        sx, sy = self._vp.map_xy(x, y)
+        sw, sh = self._vp.map_wh(w, h)
+        # alpha: ignored for now (fill writes straight RGB); use a temp surface
+        # if you really need it.
+        self._fill_rect((r, g, b), sx, sy, sw, sh)
+
+    def draw_rects(
+        self,
+        rects: Iterable[tuple[int, int, int, int]],
+        color=(255, 255, 255),
+    ):
+        """
+        Draw many filled rectangles of the same color.
+
+        Equivalent to calling ``draw_rect`` for each entry, but the viewport
+        transform and color are resolved once for the whole batch.
+
+        :param rects: Rectangles as (x, y, w, h) tuples.
+        :type rects: Iterable[tuple[int, int, int, int]]
+        :param color: The color of the rectangles as an (R, G, B) or (R, G, B, A) tuple.
+        :type color: tuple[int, int, int] | tuple[int, int, int, int]
+        """
+        rgb = rgba(color)[:3]
+        ox, oy, s = self._vp.ox, self._vp.oy, self._vp.s
+        fill = self._fill_rect
+        for x, y, w, h in rects:
+            fill(
+                rgb,
+                int(round(ox + x * s)),
+                int(round(oy + y * s)),
+                int(round(w * s)),
+                int(round(h * s)),
+            )
+
+    def _fill_rect(
+        self, rgb: tuple[int, int, int], x: int, y: int, w: int, h: int
+    ):
+        # fill() maps to SDL_FillRect, which is faster than pygame.draw.rect
+        # for solid axis-aligned rectangles. It clips against the clip rect
+        # but moves a rect with a negative origin to (0, 0) at full size, so
+        # crop that part off first.
+        if x < 0:
+            w += x
+            x = 0
+        if y < 0:
+            h += y
+            y = 0
+        if w > 0 and h > 0:
+            self._w.screen.fill(rgb, (x, y, w, h))
 
     def draw_line(
         self, x1: int, y1: int, x2: int, y2: int, color=(255, 255, 255)
@@ -123,10 +218,38 @@ class RenderPort:
         :type color: tuple[int, int, int] | tuple[int, int, int, int]
         """
         r, g, b, _ = rgba(color)
-        sx1, sy1 = self._vp.map_xy(int(x1), int(y1))
-        sx2, sy2 = self._vp.map_xy(int(x2), int(y2))
+        sx1, sy1 = self._vp.map_xy(x1, y1)
+        sx2, sy2 = self._vp.map_xy(x2, y2)
         pygame.draw.line(self._w.screen, (r, g, b), (sx1, sy1), (sx2, sy2))
 
+    def draw_lines(
+        self,
+        segments: Iterable[tuple[int, int, int, int]],
+        color=(255, 255, 255),
+    ):
+        """
+        Draw many line segments of the same color.
+
+        Equivalent to calling ``draw_line`` for each entry, but the viewport
+        transform and color are resolved once for the whole batch.
+
+        :param segments: Segments as (x1, y1, x2, y2) tuples.
+        :type segments: Iterable[tuple[int, int, int, int]]
+        :param color: The color of the lines as an (R, G, B) or (R, G, B, A) tuple.
+        :type color: tuple[int, int, int] | tuple[int, int, int, int]
+        """
+        rgb = rgba(color)[:3]
+        ox, oy, s = self._vp.ox, self._vp.oy, self._vp.s
+        screen = self._w.screen
+        line = pygame.draw.line
+        for x1, y1, x2, y2 in segments:
+            line(
+                screen,
+                rgb,
+                (int(round(ox + x1 * s)), int(round(oy + y1 * s))),
+                (int(round(ox + x2 * s)), int(round(oy + y2 * s))),
+            )
+
     def create_texture_rgba(
         self,
         w: int,
@@ -161,14 +284,24 @@ class RenderPort:
                 f"create_texture_rgba: buffer too small ({mv.nbytes}) for h*pitch ({needed})"
             )
 
+        # Only slice when the caller handed us a larger buffer.
+        if mv.nbytes != needed:
+            mv = mv[:needed]
+
         # Fast path: tightly packed RGBA rows
         if pitch == w * 4:
             # frombuffer shares memory; copy() to detach from Python buffer lifetime
-            surf = pygame.image.frombuffer(
-                mv[:needed], (w, h), "RGBA"
-            ).convert_alpha()
+            surf = pygame.image.frombuffer(mv, (w, h), "RGBA").convert_alpha()
+        elif pitch % 4 == 0:
+            # Padded rows on a pixel boundary: view the buffer as a wider
+            # image and crop it; convert_alpha() does the row copy in C.
+            surf = (
+                pygame.image.frombuffer(mv, (pitch // 4, h), "RGBA")
+                .subsurface(pygame.Rect(0, 0, w, h))
+                .convert_alpha()
+            )
         else:
-            # Slow path: repack rows (supports padded pitch)
+            # Slow path: repack rows (supports unaligned padded pitch)
             packed = bytearray(w * h * 4)
             for row in range(h):
                 src0 = row * pitch
@@ -200,21 +333,42 @@ class RenderPort:
         :param h: The height to draw the texture.
         :type h: int
         """
-        surf = self._textures.get(int(tex))
+        tex = int(tex)
+        surf = self._textures.get(tex)
         if surf is None:
             return
 
-        sx, sy = self._vp.map_xy(int(x), int(y))
-        sw, sh = self._vp.map_wh(int(w), int(h))
+        sx, sy = self._vp.map_xy(x, y)
+        sw, sh = self._vp.map_wh(w, h)
 
         if sw <= 0 or sh <= 0:
             return
 
         if surf.get_width() != sw or surf.get_height() != sh:
-            scaled = pygame.transform.scale(surf, (sw, sh))
-            self._w.screen.blit(scaled, (sx, sy))
-        else:
-            self._w.screen.blit(surf, (sx, sy))
+            surf = self._scaled(tex, surf, sw, sh)
+        self._w.screen.blit(surf, (sx, sy))
+
+    def _scaled(
+        self, tex: int, surf: pygame.Surface, sw: int, sh: int
+    ) -> pygame.Surface:
+        key = (tex, sw, sh)
+        scaled = self._scaled_cache.get(key)
+        if scaled is not None:
+            self._scaled_cache.move_to_end(key)
+            return scaled
+
+        scaled = self._w.prepare_surface(
+            pygame.transform.scale(surf, (sw, sh))
+        )
+        self._scaled_cache[key] = scaled
+        self._scaled_pixels += sw * sh
+        while (
+            self._scaled_pixels > _SCALED_CACHE_PIXELS
+            and len(self._scaled_cache) > 1
+        ):
+            (_, old_w, old_h), _ = self._scaled_cache.popitem(last=False)
+            self._scaled_pixels -= old_w * old_h
+        return scaled
 
     def destroy_texture(self, tex: int) -> None:
         """
@@ -223,7 +377,11 @@ class RenderPort:
         :param tex: The ID of the texture to destroy.
         :type tex: int
         """
-        self._textures.pop(int(tex), None)
+        tex = int(tex)
+        self._textures.pop(tex, None)
+        for key in [k for k in self._scaled_cache if k[0] == tex]:
+            del self._scaled_cache[key]
+            self._scaled_pixels -= key[1] * key[2]
 
     def draw_texture_tiled_y(
         self, tex_id: int, x: int, y: int, w: int, h: int
@@ -235,20 +393,24 @@ class RenderPort:
         surf = self._textures[tex_id]  # adapt to your texture store
         # Scale the tile to target width, keep tile height
         tile_h = surf.get_height()
-        tile = pygame.transform.scale(surf, (int(w), int(tile_h)))
+        w = int(w)
+        if tile_h <= 0 or w <= 0:
+            return
+        tile = surf
+        if surf.get_width() != w:
+            tile = self._scaled(tex_id, surf, w, tile_h)
 
-        cur_y = int(y)
+        x = int(x)
+        start_y = int(y)
         end_y = int(y + h)
 
-        while cur_y < end_y:
-            remaining = end_y - cur_y
-            if remaining >= tile_h:
-                self._w.screen.blit(tile, (int(x), cur_y))
-                cur_y += tile_h
-            else:
-                # partial tile at the end
-                partial = tile.subsurface(
-                    pygame.Rect(0, 0, int(w), int(remaining))
-                )
-                self._w.screen.blit(partial, (int(x), cur_y))
-                break
+        # Submit the whole column in one blits() call
+        seq = [
+            (tile, (x, cur_y))
+            for cur_y in range(start_y, end_y - tile_h + 1, tile_h)
+        ]
+        cur_y = start_y + len(seq) * tile_h
+        if cur_y < end_y:
+            # partial tile at the end: crop via the blit area, no subsurface
+            seq.append((tile, (x, cur_y), (0, 0, w, end_y - cur_y)))
+        self._w.screen.blits(seq, doreturn=False)
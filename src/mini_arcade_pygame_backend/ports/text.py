@@ -5,6 +5,8 @@ Provides functionality to draw and measure text.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import pygame
 from mini_arcade_core.backend.utils import (  # pyright: ignore[reportMissingImports]
     rgba,
@@ -13,6 +15,11 @@ from mini_arcade_core.backend.viewport import ViewportTransform
 
 from mini_arcade_pygame_backend.ports.window import WindowPort
 
+# Maximum number of rendered text surfaces kept around for re-use.
+_TEXT_CACHE_SIZE = 256
+# Maximum number of measured text sizes kept around for re-use.
+_MEASURE_CACHE_SIZE = 512
+
 
 class TextPort:
     """
@@ -36,6 +43,12 @@ class TextPort:
         self._vp = vp
         self._font_path = font_path
         self._fonts: dict[int, pygame.font.Font] = {}
+        self._text_cache: OrderedDict[
+            tuple[str, int | None, tuple[int, int, int]], pygame.Surface
+        ] = OrderedDict()
+        self._measure_cache: OrderedDict[
+            tuple[str, int | None], tuple[int, int]
+        ] = OrderedDict()
 
     def _font(self, font_size: int | None) -> pygame.font.Font:
         size = int(font_size or 24)
@@ -70,8 +83,16 @@ class TextPort:
             if font_size is None
             else max(8, int(round(font_size * self._vp.s)))
         )
-        f = self._font(scaled_size)
-        w_px, h_px = f.size(text)
+        key = (text, scaled_size)
+        cached = self._measure_cache.get(key)
+        if cached is None:
+            cached = self._font(scaled_size).size(text)
+            self._measure_cache[key] = cached
+            if len(self._measure_cache) > _MEASURE_CACHE_SIZE:
+                self._measure_cache.popitem(last=False)
+        else:
+            self._measure_cache.move_to_end(key)
+        w_px, h_px = cached
 
         s = self._vp.s or 1.0
         return int(round(w_px / s)), int(round(h_px / s))
@@ -108,7 +129,15 @@ class TextPort:
             if font_size is None
             else max(8, int(round(font_size * self._vp.s)))
         )
-        f = self._font(scaled_size)
+        key = (text, scaled_size, (r, g, b))
+        surf = self._text_cache.get(key)
+        if surf is None:
+            f = self._font(scaled_size)
+            surf = self._w.prepare_surface(f.render(text, True, (r, g, b)))
+            self._text_cache[key] = surf
+            if len(self._text_cache) > _TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
 
-        surf = f.render(text, True, (r, g, b))
         self._w.screen.blit(surf, (sx, sy))
@@ -12,26 +12,55 @@ class WindowPort:
     Port for window management.
     """
 
+    __slots__ = (
+        "_title",
+        "_resizeable",
+        "_flags",
+        "_alpha_masks",
+        "width",
+        "height",
+        "screen",
+    )
+
     _title: str
     _resizeable: bool
     _flags: int
     width: int
     height: int
 
-    def __init__(self, width: int, height: int, title: str, resizable: bool):
+    # Justification: Many arguments needed for window creation
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        title: str,
+        resizable: bool,
+        vsync: bool = False,
+    ):
         """
         :param native_window: The native window instance.
         :type native_window: Window
+        :param vsync: Request a vsynced display. pygame only honors vsync
+            with a hardware renderer, so this also sets ``pygame.SCALED``.
+        :type vsync: bool
         """
         self._title = title
         self._resizeable = resizable
         self._flags = pygame.RESIZABLE if resizable else 0
+        if vsync:
+            self._flags |= pygame.SCALED
 
-        self.screen = pygame.display.set_mode((width, height), self._flags)
+        # NOTE: vsync is only requested here; resize() reuses the flags
+        # without toggling it again (SDL can end up with a black window).
+        self.screen = pygame.display.set_mode(
+            (width, height), self._flags, vsync=1 if vsync else 0
+        )
         pygame.display.set_caption(title)
 
         self.width = width
         self.height = height
+        self._alpha_masks: tuple[int, int, int, int] | None = None
 
     def set_title(self, title: str):
         """
@@ -40,6 +69,8 @@ class WindowPort:
         :param title: New window title.
         :type title: str
         """
+        if title == self._title:
+            return
         self._title = title
         pygame.display.set_caption(title)
 
@@ -54,9 +85,14 @@ class WindowPort:
         """
         self.width = int(width)
         self.height = int(height)
+        # set_mode() recreates the SDL window surface; skip it when the
+        # screen already has the requested size.
+        if self.screen.get_size() == (self.width, self.height):
+            return
         self.screen = pygame.display.set_mode(
             (self.width, self.height), self._flags
         )
+        self._alpha_masks = None
 
     def size(self) -> tuple[int, int]:
         """
@@ -65,10 +101,24 @@ class WindowPort:
         :return: Tuple of (width, height) in pixels.
         :rtype: tuple[int, int]
         """
-        w, h = self.screen.get_size()
-        self.width, self.height = int(w), int(h)
+        # Kept up to date by resize() and on_resize_event().
         return self.width, self.height
 
+    def on_resize_event(self, width: int, height: int):
+        """
+        Record a window resize reported by SDL (``pygame.VIDEORESIZE``).
+
+        :param width: New window width in pixels.
+        :type width: int
+        :param height: New window height in pixels.
+        :type height: int
+        """
+        if self._flags & pygame.SCALED:
+            # The logical screen size is fixed; SDL scales it to the window.
+            return
+        self.width = width
+        self.height = height
+
     def drawable_size(self) -> tuple[int, int]:
         """
         Get the drawable size of the window.
@@ -77,3 +127,25 @@ class WindowPort:
         :rtype: tuple[int, int]
         """
         return self.size()
+
+    def prepare_surface(self, surf: pygame.Surface) -> pygame.Surface:
+        """
+        Return a surface in the display's per-pixel alpha format, so blits
+        to the screen skip SDL's per-pixel format conversion.
+
+        Surfaces already in that format are returned as-is.
+
+        :param surf: The surface to prepare.
+        :type surf: pygame.Surface
+        :return: A display-compatible surface.
+        :rtype: pygame.Surface
+        """
+        if self._alpha_masks is None:
+            self._alpha_masks = (
+                pygame.Surface((1, 1), pygame.SRCALPHA)
+                .convert_alpha()
+                .get_masks()
+            )
+        if surf.get_bitsize() == 32 and surf.get_masks() == self._alpha_masks:
+            return surf
+        return surf.convert_alpha()
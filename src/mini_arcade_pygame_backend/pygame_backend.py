@@ -25,6 +25,18 @@ class PygameBackend:
     :ivar settings: Backend settings.
     """
 
+    __slots__ = (
+        "_settings",
+        "_vp",
+        "_initialized",
+        "window",
+        "input",
+        "render",
+        "text",
+        "audio",
+        "capture",
+    )
+
     def __init__(self, settings: PygameBackendSettings) -> None:
         """
         Initialize the PygameBackend with the given settings.
@@ -50,8 +62,9 @@ class PygameBackend:
         Initialize the pygame backend.
         This method sets up the necessary components for the backend to function.
         """
-        # 1) pygame init
-        pygame.init()
+        # 1) pygame init: only the subsystems we use. pygame.init() would
+        # also open the mixer and enumerate joysticks.
+        pygame.display.init()
         pygame.font.init()
 
         # 2) create screen surface, clock, etc.
@@ -67,11 +80,18 @@ class PygameBackend:
             height=ws.height,
             title=ws.title,
             resizable=ws.resizable,
+            vsync=self._settings.vsync,
         )
 
-        self.input = InputPort()
+        self.input = InputPort(
+            self.window, poll_hz=self._settings.event_poll_hz
+        )
+        self.input.install_event_filter()
         self.render = RenderPort(
-            self.window, self._vp, background_color=rs.background_color
+            self.window,
+            self._vp,
+            background_color=rs.background_color,
+            max_fps=self._settings.max_fps,
         )
 
         font_path = fonts[0].path if fonts and fonts[0].path else None
@@ -85,8 +105,9 @@ class PygameBackend:
         if aud.enable:
             self.audio.init()
             if aud.sounds:
+                # Decoded on first play to keep startup O(1) in sound count
                 for sid, p in aud.sounds.items():
-                    self.audio.load_sound(sid, p)
+                    self.audio.register_sound(sid, p)
 
         self.capture = CapturePort(self.window)
         self._initialized = True
@@ -105,9 +126,12 @@ class PygameBackend:
         :param scale: The scale factor.
         :type scale: float
         """
-        self._vp.ox = int(offset_x)
-        self._vp.oy = int(offset_y)
-        self._vp.s = float(scale)
+        # No coercion here: called on every camera update, and the ports
+        # round through ViewportTransform.map_xy/map_wh anyway.
+        vp = self._vp
+        vp.ox = offset_x
+        vp.oy = offset_y
+        vp.s = scale
 
     def clear_viewport_transform(self):
         """Clear the viewport transform (reset to defaults)."""
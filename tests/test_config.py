@@ -0,0 +1,15 @@
+from mini_arcade_pygame_backend.config import PygameBackendSettings
+
+
+def test_to_dict_returns_independent_copies():
+    settings = PygameBackendSettings(max_fps=60)
+    d = settings.to_dict()
+    d["max_fps"] = 99
+    d["core"]["window"]["width"] = -1
+    d["core"]["fonts"].clear()
+
+    fresh = settings.to_dict()
+    assert fresh["max_fps"] == 60
+    assert fresh["core"]["window"]["width"] != -1
+    assert fresh["core"]["fonts"]
+    assert fresh == PygameBackendSettings(max_fps=60).to_dict()
@@ -0,0 +1,43 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+import pygame
+import pytest
+from mini_arcade_core.backend.viewport import ViewportTransform
+
+from mini_arcade_pygame_backend.ports.render import RenderPort
+from mini_arcade_pygame_backend.ports.window import WindowPort
+
+RED = (255, 0, 0)
+
+
+@pytest.fixture(name="window")
+def fixture_window():
+    pygame.display.init()
+    yield WindowPort(64, 48, "test", resizable=False)
+    pygame.display.quit()
+
+
+@pytest.fixture(name="render")
+def fixture_render(window):
+    return RenderPort(window, ViewportTransform())
+
+
+def _painted(surface: pygame.Surface) -> int:
+    return pygame.mask.from_threshold(surface, RED, (1, 1, 1, 255)).count()
+
+
+def test_draw_rect_clips_off_edge(window, render):
+    render.begin_frame()
+    render.draw_rect(-3, -3, 8, 8, RED)
+    assert _painted(window.screen) == 25
+    assert window.screen.get_at((0, 0))[:3] == RED
+    assert window.screen.get_at((5, 5))[:3] == (0, 0, 0)
+
+
+def test_draw_rects_clips_off_edge(window, render):
+    render.begin_frame()
+    render.draw_rects([(-3, -3, 8, 8), (60, 44, 8, 8), (-10, 0, 5, 5)], RED)
+    assert _painted(window.screen) == 25 + 16